@@ -10,16 +10,34 @@ _CONFIG_FILE_NAME = "sentinel_config.json"
 _DEFAULT_SIZE_FRACTION = 0.10
 _DEFAULT_SWEEP_INTERVAL_DAYS = 14
 
+# (mtime_ns, size) of the config file when last read/written, and what it held
+_cache: tuple[tuple[int, int], dict] | None = None
+
 
 def _get_config_path() -> Path:
-    """Return the path to the config file in user data directory."""
+    """Return the path to the config file in user data directory (not created here)."""
     if hasattr(Path, "home"):
         base = Path.home()
     else:
         base = Path(os.environ.get("APPDATA", "."))
-    config_dir = base / _CONFIG_DIR_NAME
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir / _CONFIG_FILE_NAME
+    return base / _CONFIG_DIR_NAME / _CONFIG_FILE_NAME
+
+
+def _default_config() -> dict:
+    """Config used when the file is missing or unreadable."""
+    return {
+        "last_drive": None,
+        "check_size_fraction": _DEFAULT_SIZE_FRACTION,
+        "sweep_interval_days": _DEFAULT_SWEEP_INTERVAL_DAYS,
+        "last_check_time": None,
+        "last_sweep_time": None,
+    }
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    """(mtime_ns, size) of path; raises OSError if missing."""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
 
 
 def load_config() -> dict:
@@ -27,20 +45,20 @@ def load_config() -> dict:
     Load config from JSON file.
     Returns dict with keys: last_drive, check_size_fraction, sweep_interval_days,
     last_check_time (iso str or None), last_sweep_time (iso str or None, fallback when not on card).
+    The parsed file is reused until its mtime/size change, so frequent callers pay one stat.
     """
+    global _cache
     config_path = _get_config_path()
-    if not config_path.exists():
-        return {
-            "last_drive": None,
-            "check_size_fraction": _DEFAULT_SIZE_FRACTION,
-            "sweep_interval_days": _DEFAULT_SWEEP_INTERVAL_DAYS,
-            "last_check_time": None,
-            "last_sweep_time": None,
-        }
+    try:
+        key = _stat_key(config_path)
+    except OSError:
+        return _default_config()
+    if _cache is not None and _cache[0] == key:
+        return dict(_cache[1])
     try:
         with open(config_path, encoding="utf-8") as f:
             data = json.load(f)
-        return {
+        config = {
             "last_drive": data.get("last_drive"),
             "check_size_fraction": data.get("check_size_fraction", _DEFAULT_SIZE_FRACTION),
             "sweep_interval_days": data.get("sweep_interval_days", _DEFAULT_SWEEP_INTERVAL_DAYS),
@@ -48,13 +66,9 @@ def load_config() -> dict:
             "last_sweep_time": data.get("last_sweep_time"),
         }
     except (json.JSONDecodeError, OSError):
-        return {
-            "last_drive": None,
-            "check_size_fraction": _DEFAULT_SIZE_FRACTION,
-            "sweep_interval_days": _DEFAULT_SWEEP_INTERVAL_DAYS,
-            "last_check_time": None,
-            "last_sweep_time": None,
-        }
+        return _default_config()
+    _cache = (key, config)
+    return dict(config)
 
 
 def save_config(
@@ -68,6 +82,7 @@ def save_config(
     Save config to JSON file.
     Pass only the keys to update; others are preserved.
     """
+    global _cache
     config_path = _get_config_path()
     current = load_config()
     if last_drive is not None:
@@ -80,5 +95,7 @@ def save_config(
         current["last_check_time"] = last_check_time
     if last_sweep_time is not None:
         current["last_sweep_time"] = last_sweep_time
+    config_path.parent.mkdir(parents=True, exist_ok=True)
     with open(config_path, "w", encoding="utf-8") as f:
         json.dump(current, f, indent=2)
+    _cache = (_stat_key(config_path), current)
@@ -1,10 +1,16 @@
 """Integrity check logic for Sentinel."""
 
 import hashlib
+import mmap
 import os
-import random
 import secrets
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from sentinel.drive import get_drive_usage
@@ -13,6 +19,12 @@ SAFETY_MARGIN_BYTES = 100 * 1024 * 1024  # 100 MB
 MAX_FILE_BYTES = 2 * 1024 * 1024 * 1024  # 2 GB cap (FAT32 limit 4GB; avoids large-write issues)
 WRITE_CHUNK_BYTES = 64 * 1024 * 1024  # 64 MB per write chunk
 TEMP_DIR_PREFIX = "SentinelCheck"
+DIRECT_IO_ALIGN = 4096  # uncached reads need page-aligned buffers and sector-multiple sizes
+
+_FILE_FLAG_NO_BUFFERING = 0x20000000
+_FILE_FLAG_SEQUENTIAL_SCAN = 0x08000000
+
+_expected_hashes: dict[tuple[int, int], str] = {}  # (seed, size) -> payload digest
 
 
 def quick_check(
@@ -25,8 +37,8 @@ def quick_check(
     Run a quick integrity check on the given drive.
 
     Writes test files in batches (each batch capped at 2GB, written in 64MB chunks),
-    total size = size_fraction of drive. Each batch: write → verify (read 2×) → pass/fail
-    before the next. Deletes all test data before returning.
+    total size = size_fraction of drive. Each batch: write → verify (read 2×) → pass/fail;
+    a batch's verify runs while the next batch is written. Deletes all test data before returning.
 
     Args:
         drive_root: Path to drive root (e.g. "C:\\" or "G:\\").
@@ -39,7 +51,9 @@ def quick_check(
         aborted=True, batches_completed, batches_total, bytes_tested, bytes_total,
         extrapolated_confidence_pct.
     """
-    total_bytes_d, free_bytes_d = get_drive_usage(drive_root)
+    if progress_callback:
+        progress_callback = _Throttled(progress_callback)
+    total_bytes_d, free_bytes_d = get_drive_usage(drive_root, fresh=True)
     target_bytes = int(size_fraction * total_bytes_d)
     usable_bytes = max(0, free_bytes_d - SAFETY_MARGIN_BYTES)
     size_bytes = min(target_bytes, usable_bytes)
@@ -59,7 +73,7 @@ def quick_check(
         batch_sizes.append(min(remaining, MAX_FILE_BYTES))
         remaining -= batch_sizes[-1]
     num_batches = len(batch_sizes)
-    total_steps = num_batches * 3  # write, verify1, verify2 per batch
+    total_steps = num_batches * 2  # write, verify per batch
 
     date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
     short_random = secrets.token_hex(4)
@@ -78,104 +92,77 @@ def quick_check(
 
     verification_details = []
     aborted = False
+    # One read buffer for every verify pass of this check, instead of a fresh 64MB bytes per chunk
+    scratch = _aligned_buffer(min(WRITE_CHUNK_BYTES, size_bytes))
+
+    failure = None
+    # The verifier never calls the caller's callbacks: progress is reported from this thread,
+    # and an abort seen here is passed on to it through stop
+    stop = threading.Event()
 
     try:
-        for batch_i, fsize in enumerate(batch_sizes):
-            if abort_check and abort_check():
-                aborted = True
-                break
+        # Batch i is read back on a worker while batch i + 1 is being written
+        with ThreadPoolExecutor(max_workers=1) as verifier:
+            pending = None
+            for batch_i, fsize in enumerate(batch_sizes):
+                if abort_check and abort_check():
+                    aborted = True
+                    break
 
-            file_path = temp_path / f"test_{batch_i}.bin"
+                file_path = temp_path / f"test_{batch_i}.bin"
 
-            # Write batch in 64MB chunks
-            if progress_callback:
-                progress_callback(
-                    batch_i * 3,
-                    total_steps,
-                    f"Writing batch {batch_i + 1}/{num_batches}…",
-                )
-            hasher = hashlib.sha256()
-            rng = random.Random(batch_i)
-            try:
-                with open(file_path, "wb") as f:
-                    written = 0
-                    while written < fsize:
-                        chunk_size = min(WRITE_CHUNK_BYTES, fsize - written)
-                        chunk = rng.randbytes(chunk_size)
-                        hasher.update(chunk)
-                        f.write(chunk)
-                        written += chunk_size
-            except OSError as e:
-                return {
-                    "passed": False,
-                    "message": "Integrity check failed",
-                    "details": f"Write error (batch {batch_i + 1}): {e}",
-                    "verification_details": verification_details,
-                }
-            expected_hash = hasher.hexdigest()
-
-            # Verify read 1
-            if progress_callback:
-                progress_callback(
-                    batch_i * 3 + 1,
-                    total_steps,
-                    f"Verifying batch {batch_i + 1}/{num_batches} (read 1)…",
-                )
-            try:
-                h1 = _hash_file_chunked(file_path, WRITE_CHUNK_BYTES)
-            except OSError as e:
-                return {
-                    "passed": False,
-                    "message": "Integrity check failed",
-                    "details": f"Read error (batch {batch_i + 1}): {e}",
-                    "verification_details": verification_details,
-                }
-            if h1 != expected_hash:
-                verification_details.append({
-                    "batch": batch_i + 1,
-                    "expected_hash": expected_hash,
-                    "read1_hash": h1,
-                    "read2_hash": None,
-                    "match": False,
-                })
-                return {
-                    "passed": False,
-                    "message": "Integrity check failed",
-                    "details": f"Hash mismatch on batch {batch_i + 1} (first read).",
-                    "verification_details": verification_details,
-                }
-
-            # Verify read 2
-            if progress_callback:
-                progress_callback(
-                    batch_i * 3 + 2,
-                    total_steps,
-                    f"Verifying batch {batch_i + 1}/{num_batches} (read 2)…",
+                # Write batch in 64MB chunks
+                if progress_callback:
+                    message = f"Writing batch {batch_i + 1}/{num_batches}"
+                    if pending is not None:
+                        message += f", verifying batch {batch_i}/{num_batches}"
+                    progress_callback(batch_i * 2, total_steps, message + "…")
+                try:
+                    expected_hash = _write_test_file(file_path, fsize, batch_i, abort_check)
+                except OSError as e:
+                    failure = f"Write error (batch {batch_i + 1}): {e}"
+                    break
+                if expected_hash is None:
+                    aborted = True
+                    break
+
+                if pending is not None:
+                    detail, failure = _collect(pending, abort_check, stop)
+                    pending = None
+                    if detail is not None:
+                        verification_details.append(detail)
+                    elif not failure:
+                        aborted = True
+                    if failure or aborted:
+                        break
+
+                # Verify reads 1 and 2
+                if progress_callback:
+                    progress_callback(
+                        batch_i * 2 + 1,
+                        total_steps,
+                        f"Verifying batch {batch_i + 1}/{num_batches}…",
+                    )
+                pending = verifier.submit(
+                    _verify_batch, file_path, batch_i + 1, expected_hash, scratch, stop.is_set
                 )
-            try:
-                h2 = _hash_file_chunked(file_path, WRITE_CHUNK_BYTES)
-            except OSError as e:
-                return {
-                    "passed": False,
-                    "message": "Integrity check failed",
-                    "details": f"Read error (batch {batch_i + 1}, second pass): {e}",
-                    "verification_details": verification_details,
-                }
-            match = h1 == expected_hash and h2 == expected_hash and h1 == h2
-            verification_details.append({
-                "batch": batch_i + 1,
-                "expected_hash": expected_hash,
-                "read1_hash": h1,
-                "read2_hash": h2,
-                "match": match,
-            })
-            if not match:
-                return {
-                    "passed": False,
-                    "message": "Integrity check failed",
-                    "details": f"Hash mismatch on batch {batch_i + 1} (second read).",
-                    "verification_details": verification_details,
-                }
+
+            if pending is not None:
+                detail, pending_failure = _collect(pending, abort_check, stop)
+                if detail is not None:
+                    verification_details.append(detail)
+                elif not pending_failure:
+                    aborted = True
+                # The earlier batch's failure wins over a write error on the batch after it
+                failure = pending_failure or failure
+
+        if failure:
+            return {
+                "passed": False,
+                "message": "Integrity check failed",
+                "details": failure,
+                "verification_details": verification_details,
+            }
 
         if aborted:
             batches_completed = len(verification_details)
@@ -216,13 +203,321 @@ def quick_check(
             pass
 
 
-def _hash_file_chunked(path: Path, chunk_size: int) -> str:
-    """Read file in chunks and return SHA-256 hex digest."""
-    hasher = hashlib.sha256()
-    with open(path, "rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
+class _Throttled:
+    """
+    Progress callback wrapper. An update for a new step always passes (a phase message is
+    never lost for the whole phase); repeats of the same step arriving within min_interval
+    seconds of the last update passed are dropped. The first and final (current >= total)
+    updates always pass.
+    The reported step never goes backwards: an update for an earlier step than the last one
+    passed is dropped. Safe to call from several threads; callback runs outside the lock.
+    """
+
+    def __init__(self, callback, min_interval: float = 0.1):
+        self._callback = callback
+        self._min_interval = min_interval
+        self._last = None
+        self._step = None
+        self._lock = threading.Lock()
+
+    def due(self, current, total) -> bool:
+        """
+        True if min_interval has passed since the last update (or it is the first or final one).
+        For loops that advance one step per item: check this before building the message, so
+        only about one item per min_interval is reported.
+        """
+        if self._step is not None and current < self._step:
+            return False
+        if self._last is None or current >= total:
+            return True
+        return time.perf_counter() - self._last >= self._min_interval
+
+    def __call__(self, current, total, message):
+        with self._lock:
+            if not (self._step is None or current > self._step or self.due(current, total)):
+                return
+            self._last = time.perf_counter()
+            self._step = current
+        self._callback(current, total, message)
+
+
+def _collect(fut, abort_check, stop: threading.Event):
+    """
+    Wait for a _verify_batch future and return its result. abort_check() is polled here,
+    on the caller's thread, while waiting; once it is True, stop is set so the verify ends.
+    """
+    while True:
+        try:
+            return fut.result(timeout=0.1)
+        except TimeoutError:
+            if abort_check and abort_check():
+                stop.set()
+
+
+def _verify_batch(
+    file_path: Path, batch_no: int, expected_hash: str, buf, abort_check=None
+) -> tuple[dict | None, str | None]:
+    """
+    Read a quick check batch file back twice (uncached) and compare with expected_hash.
+    Returns (verification detail, or None after a read error; failure details, or None if matched).
+    (None, None) means abort_check() turned True during a read.
+    """
+    try:
+        h1 = _hash_file_chunked(file_path, WRITE_CHUNK_BYTES, buf, uncached=True, abort_check=abort_check)
+    except OSError as e:
+        return None, f"Read error (batch {batch_no}): {e}"
+    if h1 is None:
+        return None, None
+    if h1 != expected_hash:
+        return {
+            "batch": batch_no,
+            "expected_hash": expected_hash,
+            "read1_hash": h1,
+            "read2_hash": None,
+            "match": False,
+        }, f"Hash mismatch on batch {batch_no} (first read)."
+
+    try:
+        h2 = _hash_file_chunked(file_path, WRITE_CHUNK_BYTES, buf, uncached=True, abort_check=abort_check)
+    except OSError as e:
+        return None, f"Read error (batch {batch_no}, second pass): {e}"
+    if h2 is None:
+        return None, None
+    match = h1 == expected_hash and h2 == expected_hash and h1 == h2
+    detail = {
+        "batch": batch_no,
+        "expected_hash": expected_hash,
+        "read1_hash": h1,
+        "read2_hash": h2,
+        "match": match,
+    }
+    return detail, None if match else f"Hash mismatch on batch {batch_no} (second read)."
+
+
+def _new_hasher():
+    """
+    Return a new hash object for verification digests.
+    SHA-256 stays: OpenSSL already uses SHA-NI where the CPU has it (faster than blake2b there),
+    and saved manifests are SHA-256, so switching would invalidate them.
+    """
+    return hashlib.sha256()
+
+
+def _payload(seed: int, size: int):
+    """
+    Yield size bytes of test data for batch seed, in chunks of up to WRITE_CHUNK_BYTES.
+    Each chunk is a single SHAKE-128 squeeze keyed by (seed, chunk index): reproducible,
+    incompressible, and generated in C in one call, well ahead of random.randbytes.
+    Not os.urandom/secrets: the data does not need to be unpredictable.
+    """
+    full_chunks, tail = divmod(size, WRITE_CHUNK_BYTES)
+    for index in range(full_chunks):
+        yield hashlib.shake_128(b"%d:%d" % (seed, index)).digest(WRITE_CHUNK_BYTES)
+    if tail:
+        yield hashlib.shake_128(b"%d:%d" % (seed, full_chunks)).digest(tail)
+
+
+def _write_test_file(path: Path, size: int, seed: int, abort_check=None) -> str | None:
+    """
+    Write size bytes of test data (batch seed) to path and return its SHA-256 hex digest.
+    Each chunk is written on a worker thread while the next one is generated and hashed,
+    so PRNG and hashing overlap the blocking write. The payload is deterministic, so the
+    digest is remembered per (seed, size) and later writes of the same batch skip hashing.
+    The file is fsynced (and dropped from the page cache where supported) before returning.
+    abort_check() is polled before each chunk; returns None (file left partial) if it is True.
+    Raises OSError on write failure.
+    """
+    expected_hash = _expected_hashes.get((seed, size))
+    hasher = _new_hasher() if expected_hash is None else None
+    with open(path, "wb", buffering=0) as f, ThreadPoolExecutor(max_workers=1) as writer:
+        pending = None
+        aborted = False
+        for chunk in _payload(seed, size):
+            if abort_check and abort_check():
+                aborted = True
                 break
-            hasher.update(chunk)
+            if hasher is not None:
+                hasher.update(chunk)
+            if pending is not None:
+                pending.result()
+            pending = writer.submit(_write_all, f, chunk)
+        if pending is not None:
+            pending.result()
+        if aborted:
+            return None
+        # Write-through: the data must be on the card, not in the OS cache, before it is read back
+        os.fsync(f.fileno())
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    if hasher is not None:
+        expected_hash = hasher.hexdigest()
+        _expected_hashes[(seed, size)] = expected_hash
+    return expected_hash
+
+
+def _write_all(f, data) -> None:
+    """Write all of data to the raw (unbuffered) file f; raw writes may be partial."""
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view):]
+
+
+def _aligned_buffer(size: int) -> mmap.mmap:
+    """Return a page-aligned read buffer of at least size bytes, rounded up to DIRECT_IO_ALIGN."""
+    size = max(DIRECT_IO_ALIGN, -(-size // DIRECT_IO_ALIGN) * DIRECT_IO_ALIGN)
+    return mmap.mmap(-1, size)
+
+
+def _open_sequential(path: Path, uncached: bool = False):
+    """
+    Open path as a raw file for one sequential pass, telling the OS so
+    (FILE_FLAG_SEQUENTIAL_SCAN on Windows, POSIX_FADV_SEQUENTIAL/NOREUSE elsewhere) so it
+    reads ahead and doesn't keep the pages around.
+    uncached=True also bypasses the OS file cache (FILE_FLAG_NO_BUFFERING / O_DIRECT) so
+    verify reads come from the card rather than RAM.
+    Returns (raw file, uncached); uncached is False when the platform or filesystem refused,
+    in which case the file's cached pages are dropped first where the OS allows it.
+    """
+    wanted_uncached = uncached
+    f = None
+    if sys.platform == "win32":
+        flags = _FILE_FLAG_SEQUENTIAL_SCAN
+        if uncached:
+            try:
+                fd = _win32_opener()(path, flags | _FILE_FLAG_NO_BUFFERING)
+                return open(fd, "rb", buffering=0), True
+            except OSError:
+                pass
+        try:
+            f = open(_win32_opener()(path, flags), "rb", buffering=0)
+        except OSError:
+            pass  # plain open below raises the proper error
+    elif uncached and hasattr(os, "O_DIRECT"):
+        try:
+            f = open(os.open(path, os.O_RDONLY | os.O_DIRECT), "rb", buffering=0)
+        except OSError:
+            f = None
+        else:
+            uncached = True
+    if f is None:
+        f = open(path, "rb", buffering=0)
+        uncached = False
+    if hasattr(os, "posix_fadvise"):
+        try:
+            if wanted_uncached and not uncached:
+                # Best effort when direct I/O is refused: drop whatever is cached so
+                # this pass still reads from the card
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_NOREUSE)
+        except OSError:
+            pass
+    return f, uncached
+
+
+@lru_cache(maxsize=1)
+def _win32_opener():
+    """
+    Return open_fd(path, flags): CreateFileW for reading with the given FILE_FLAG_*, as a
+    C runtime fd; raises OSError. kernel32 and the prototypes are set up once, on first use.
+    """
+    import ctypes
+    import msvcrt
+    from ctypes import wintypes
+
+    generic_read = 0x80000000
+    file_share_read_write = 0x00000001 | 0x00000002
+    open_existing = 3
+    invalid_handle_value = wintypes.HANDLE(-1).value
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    create_file = kernel32.CreateFileW
+    create_file.argtypes = (
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+    )
+    create_file.restype = wintypes.HANDLE
+    close_handle = kernel32.CloseHandle
+    close_handle.argtypes = (wintypes.HANDLE,)
+
+    def open_fd(path: Path, flags: int) -> int:
+        handle = create_file(str(path), generic_read, file_share_read_write, None, open_existing, flags, None)
+        if handle is None or handle == invalid_handle_value:
+            raise ctypes.WinError(ctypes.get_last_error())
+        try:
+            return msvcrt.open_osfhandle(handle, os.O_RDONLY | os.O_BINARY)
+        except OSError:
+            close_handle(handle)
+            raise
+
+    return open_fd
+
+
+def _pick_chunk_size(file_size: int) -> int:
+    """
+    Read chunk size for hashing a file of file_size bytes: 64 KB under 1 MB, 1 MB under 1 GB,
+    4 MB above. Small files don't need big buffers; large ones keep read-ahead busy with
+    fewer syscalls. All sizes are multiples of DIRECT_IO_ALIGN.
+    """
+    if file_size < 1024 * 1024:
+        return 64 * 1024
+    if file_size < 1024 * 1024 * 1024:
+        return 1024 * 1024
+    return 4 * 1024 * 1024
+
+
+def _hash_file_chunked(
+    path: Path, chunk_size: int, buf=None, uncached: bool = False, abort_check=None
+) -> str | None:
+    """
+    Read file in chunks and return SHA-256 hex digest (see _read_into_hashers).
+    None if abort_check() turned True before the whole file was read.
+    """
+    hasher = _new_hasher()
+    if not _read_into_hashers(path, chunk_size, (hasher,), buf, uncached, abort_check):
+        return None
     return hasher.hexdigest()
+
+
+class _Crc32:
+    """hashlib-style wrapper around zlib.crc32: a cheap check value, ~3x faster than SHA-256."""
+
+    def __init__(self):
+        self._crc = 0
+
+    def update(self, data) -> None:
+        self._crc = zlib.crc32(data, self._crc)
+
+    def hexdigest(self) -> str:
+        return f"{self._crc:08x}"
+
+
+def _read_into_hashers(
+    path: Path, chunk_size: int, hashers, buf=None, uncached: bool = False, abort_check=None
+) -> bool:
+    """
+    Read file in chunks, feeding every chunk to each hasher (hashlib-style update()).
+    Reads go straight from the unbuffered file into buf (up to chunk_size bytes at a time),
+    so no per-chunk bytes object or buffered-layer copy. Callers hashing many chunks should
+    pass one buf; otherwise one is allocated, no larger than the file.
+    uncached=True bypasses the OS file cache (see _open_sequential); buf must then come from
+    _aligned_buffer and chunk_size be a multiple of DIRECT_IO_ALIGN.
+    abort_check() is polled before each chunk. Returns False if it stopped the read, else True.
+    """
+    f, uncached = _open_sequential(path, uncached)
+    with f:
+        if buf is None:
+            size = max(1, min(chunk_size, os.fstat(f.fileno()).st_size))
+            buf = _aligned_buffer(size) if uncached else bytearray(size)
+        view = memoryview(buf)[:chunk_size]
+        while True:
+            if abort_check and abort_check():
+                return False
+            n = f.readinto(view)
+            if not n:
+                break
+            for hasher in hashers:
+                hasher.update(view[:n])
+            if uncached and n < len(view):
+                break  # EOF; a further uncached read at the unaligned end offset would fail
+    return True
@@ -1,26 +1,48 @@
 """Drive enumeration and disk usage for Sentinel."""
 
+import os
 import shutil
-from pathlib import Path
+import sys
+import time
+
+_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+USAGE_TTL_SECONDS = 2.0  # one user action (recommendation + check) shares one query
+
+_usage_cache: dict[str, tuple[float, tuple[int, int]]] = {}
 
 
 def get_available_drives() -> list[str]:
     """
     Return a list of available Windows drive roots (e.g. ["C:\\", "G:\\"]).
-    Iterates A–Z and checks Path(f"{d}:\\").exists().
+    Checks os.path.exists(f"{d}:\\") for each letter; on Windows only for the letters in the
+    GetLogicalDrives bitmask (one call), not all of A–Z.
     """
+    letters = _LETTERS
+    if sys.platform == "win32":
+        import ctypes
+
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+        if mask:
+            letters = [letter for i, letter in enumerate(_LETTERS) if mask & (1 << i)]
     drives = []
-    for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-        root = Path(f"{letter}:\\")
-        if root.exists():
-            drives.append(str(root))
+    for letter in letters:
+        root = f"{letter}:\\"
+        if os.path.exists(root):
+            drives.append(root)
     return drives
 
 
-def get_drive_usage(path: str) -> tuple[int, int]:
+def get_drive_usage(path: str, fresh: bool = False) -> tuple[int, int]:
     """
     Return (total_bytes, free_bytes) for the given path.
-    Uses shutil.disk_usage.
+    Uses shutil.disk_usage; a result is reused for USAGE_TTL_SECONDS. fresh=True always
+    queries (for sizing test writes, where a stale free-space value would run out of space).
     """
+    now = time.monotonic()
+    cached = _usage_cache.get(path)
+    if not fresh and cached and now - cached[0] < USAGE_TTL_SECONDS:
+        return cached[1]
     usage = shutil.disk_usage(path)
-    return usage.total, usage.free
+    result = (usage.total, usage.free)
+    _usage_cache[path] = (now, result)
+    return result
@@ -1,36 +1,60 @@
 """Full sweep logic for Sentinel Phase 2."""
 
-import hashlib
 import json
 import os
-import random
 import secrets
+import stat
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 from sentinel.config import _get_config_path
 from sentinel.core import (
     MAX_FILE_BYTES,
     SAFETY_MARGIN_BYTES,
-    WRITE_CHUNK_BYTES,
+    TEMP_DIR_PREFIX as CHECK_TEMP_DIR_PREFIX,
+    _Crc32,
+    _Throttled,
+    _aligned_buffer,
     _hash_file_chunked,
+    _new_hasher,
+    _pick_chunk_size,
+    _read_into_hashers,
+    _write_test_file,
 )
 from sentinel.drive import get_drive_usage
 
 SENTINEL_DIR = "Sentinel"
 LAST_SWEEP_FILE = ".last_sweep"
 TEMP_DIR_PREFIX = "SentinelSweep"
+MANIFEST_VERSION = 2  # {"version": 2, "files": {path: {"h", "c", "s", "m"}}}; v1 was {path: hash}
+HASH_WORKERS = 2  # one file read while another is hashed; more streams only make one card seek
+# Leftover quick check / sweep temp folders (e.g. after a crash) at the drive root
+_OWN_TEMP_PREFIXES = (f"{CHECK_TEMP_DIR_PREFIX}_", f"{TEMP_DIR_PREFIX}_")
+_NEEDS_NORM = os.sep != "/"  # manifest paths always use "/"; only Windows needs converting
+_DIGESTS = {"h": _new_hasher, "c": _Crc32}  # manifest entry key -> hasher (SHA-256, CRC-32)
+
+
+@lru_cache(maxsize=1)
+def _manifest_dir() -> Path:
+    """Manifests folder on PC; created on first use."""
+    base = _get_config_path().parent / "manifests"
+    base.mkdir(parents=True, exist_ok=True)
+    return base
 
 
 def _manifest_path(drive_root: str) -> Path:
     """Path to manifest file on PC (per drive)."""
-    base = _get_config_path().parent
     letter = drive_root.replace("\\", "").replace(":", "").upper() or "UNKNOWN"
-    base = base / "manifests"
-    base.mkdir(parents=True, exist_ok=True)
-    return base / f"{letter}.json"
+    return _manifest_dir() / f"{letter}.json"
 
 
+@lru_cache(maxsize=16)
 def _sentinel_path(drive_root: str) -> Path:
     """Path to Sentinel folder on card."""
     return Path(drive_root) / SENTINEL_DIR
@@ -58,118 +82,296 @@ def write_last_sweep_timestamp(drive_root: str) -> None:
 
 def sweep_due(drive_root: str, interval_days: int) -> bool:
     """True if full sweep is due (no timestamp or >= interval_days since last)."""
-    last = read_last_sweep_timestamp(drive_root)
+    return _due_since(read_last_sweep_timestamp(drive_root), interval_days)
+
+
+def _due_since(last: datetime | None, interval_days: int) -> bool:
+    """sweep_due for an already-read last sweep timestamp (None = never swept)."""
     if last is None:
         return True
     delta = datetime.now() - last
     return delta.days >= interval_days
 
 
+def _hash_files(jobs: list[tuple[str, str]], workers: int = HASH_WORKERS, abort_check=None):
+    """
+    Hash files on worker threads. jobs: (path, digest keys), keys from _DIGESTS, e.g. "hc"
+    for SHA-256 and CRC-32 in one read. Yields {key: hex digest} (or the OSError raised, or
+    None if abort_check() turned True mid-file) per job, in order. Reading one file overlaps
+    hashing another. At most 2 * workers files are in flight, so closing the generator early
+    (abort) only waits for those.
+    """
+    local = threading.local()
+
+    def hash_one(job):
+        path, keys = job
+        try:
+            file_size = os.stat(path).st_size
+            chunk_size = _pick_chunk_size(file_size)
+            size = min(chunk_size, max(1, file_size))
+            buf = getattr(local, "buf", None)
+            if buf is None or len(buf) < size:
+                buf = local.buf = bytearray(size)  # per-thread, grown to the largest chunk used
+            hashers = [_DIGESTS[k]() for k in keys]
+            if not _read_into_hashers(path, chunk_size, hashers, buf, abort_check=abort_check):
+                return None
+            return {k: hasher.hexdigest() for k, hasher in zip(keys, hashers)}
+        except OSError as e:
+            return e
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = iter(jobs)
+        in_flight = deque(pool.submit(hash_one, p) for p in islice(pending, 2 * workers))
+        while in_flight:
+            fut = in_flight.popleft()
+            for p in islice(pending, 1):
+                in_flight.append(pool.submit(hash_one, p))
+            yield fut.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _is_own_dir(name: str) -> bool:
+    """True for a drive-root folder Sentinel itself creates: Sentinel/ and check/sweep temp dirs."""
+    return name == SENTINEL_DIR or name.startswith(_OWN_TEMP_PREFIXES)
+
+
+def _walk(root: str, skip_at_root):
+    """
+    Yield os.DirEntry for every non-directory under root (depth-first, via os.scandir).
+    Directories directly under root for which skip_at_root(name) is True are pruned without
+    being entered; symlinked directories are not followed. Unreadable directories are skipped.
+    """
+    stack = [(root, True)]
+    while stack:
+        path, at_root = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if not (at_root and skip_at_root(entry.name)):
+                        stack.append((entry.path, False))
+                else:
+                    yield entry
+
+
 def build_manifest(
     drive_root: str, progress_callback=None, abort_check=None
-) -> tuple[dict[str, str], list[str], bool]:
+) -> tuple[dict[str, dict], list[str], bool]:
     """
-    Build manifest of all files on drive (path -> hash). Skips Sentinel dir.
+    Build manifest of all files on drive (path -> {"h": hash, "c": crc32, "s": size, "m": mtime_ns}).
+    Skips the Sentinel dir and leftover check/sweep temp dirs at the drive root.
     Returns (manifest_dict, list of paths hashed, aborted).
     """
-    root = Path(drive_root)
+    if progress_callback:
+        progress_callback = _Throttled(progress_callback)
+    root_str = os.path.join(drive_root, "")  # with trailing separator, for slicing off rel paths
     manifest = {}
     paths = []
-    sentinel_abs = _sentinel_path(drive_root)
 
-    all_files = []
-    for p in root.rglob("*"):
-        if p.is_file() and not str(p).startswith(str(sentinel_abs)):
-            all_files.append(p)
+    all_files = []  # (path, rel, stat)
+    for entry in _walk(drive_root, _is_own_dir):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            continue
+        rel = entry.path[len(root_str):]
+        if _NEEDS_NORM:
+            rel = rel.replace(os.sep, "/")
+        all_files.append((entry.path, rel, st))
+    # Largest first: the big files start on the hash workers straight away instead of one
+    # landing last and running alone while the other workers sit idle
+    all_files.sort(key=lambda f: f[2].st_size, reverse=True)
     total = len(all_files)
 
-    for i, p in enumerate(all_files):
-        if abort_check and abort_check():
-            return manifest, paths, True
-        if progress_callback:
-            progress_callback(i, max(total, 1), f"Building manifest: {p.name[:40]}…")
-        try:
-            h = _hash_file_chunked(p, WRITE_CHUNK_BYTES)
-            rel = str(p.relative_to(root)).replace("\\", "/")
-            manifest[rel] = h
+    with closing(_hash_files([(p, "hc") for p, _, _ in all_files], abort_check=abort_check)) as results:
+        for i, (p, rel, st) in enumerate(all_files):
+            if abort_check and abort_check():
+                return manifest, paths, True
+            if progress_callback and progress_callback.due(i, max(total, 1)):
+                progress_callback(i, max(total, 1), f"Building manifest: {os.path.basename(p)[:40]}…")
+            h = next(results)
+            if h is None:
+                return manifest, paths, True
+            if isinstance(h, OSError):
+                continue  # skip unreadable files
+            manifest[rel] = {**h, "s": st.st_size, "m": st.st_mtime_ns}
             paths.append(rel)
-        except OSError:
-            pass  # skip unreadable files
     return manifest, paths, False
 
 
-def save_manifest(drive_root: str, manifest: dict[str, str]) -> None:
-    """Save manifest to PC."""
+def save_manifest(drive_root: str, manifest: dict[str, dict]) -> None:
+    """
+    Save manifest to PC. Written to a temp file and swapped in with os.replace, so an
+    interrupted save leaves the previous manifest intact instead of a truncated one.
+    """
     path = _manifest_path(drive_root)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    # Compact, serialized in one C-accelerated call and written at once: indent=2 through
+    # json.dump's incremental writer is several times slower on large cards
+    data = json.dumps({"version": MANIFEST_VERSION, "files": manifest}, separators=(",", ":"))
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if hasattr(os, "O_DIRECTORY"):
+        # Make the rename itself durable (POSIX only; Windows can't open directories)
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 
-def load_manifest(drive_root: str) -> dict[str, str] | None:
-    """Load manifest from PC. Returns None if not found."""
+def load_manifest(drive_root: str) -> dict[str, dict] | None:
+    """
+    Load manifest from PC (path -> {"h": hash, "s": size, "m": mtime_ns}). Returns None if not found.
+    Manifests saved before size/mtime were recorded ({path: hash}) load as {"h": hash} entries.
+    """
     path = _manifest_path(drive_root)
     if not path.exists():
         return None
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        data = json.loads(path.read_bytes())
+    except (ValueError, OSError):
         return None
+    if not isinstance(data, dict):
+        return None
+    if data.get("version") == MANIFEST_VERSION and isinstance(data.get("files"), dict):
+        return data["files"]
+    return {rel: {"h": h} for rel, h in data.items()}
 
 
 def verify_manifest(
     drive_root: str,
-    manifest: dict[str, str],
+    manifest: dict[str, dict],
     progress_callback=None,
     abort_check=None,
+    mode: str = "hash",
 ) -> tuple[bool, list[str], list[dict], bool]:
     """
-    Re-read and re-hash all files in manifest; compare.
+    Re-read and re-hash all files in manifest; compare. Entries with a CRC-32 ("c") are
+    checked against it first (cheaper than SHA-256). A CRC mismatch always fails the file; the
+    file is then read again for the SHA-256 to report, and if that second read matches the
+    entry carries note "crc mismatch; sha re-read matched" (a flaky read, not a clean file).
+    mode="stat" only checks that each file exists with its recorded size and mtime (no reads,
+    so it does not test the media); entries saved without size/mtime are still hashed.
+    Stat-checked entries carry note "stat-only".
     Returns (passed, list of mismatches, verification_details, aborted).
     """
-    root = Path(drive_root)
+    if progress_callback:
+        progress_callback = _Throttled(progress_callback)
+    root_str = os.path.join(drive_root, "")
     mismatches = []
     verification_details = []
     entries = list(manifest.items())
     total = max(len(entries), 1)
-
-    for i, (rel, expected_hash) in enumerate(entries):
-        if abort_check and abort_check():
-            return len(mismatches) == 0, mismatches, verification_details, True
-        if progress_callback:
-            progress_callback(i, total, f"Verifying files: {rel[:40]}…")
-        path = root / rel.replace("/", os.sep)
-        if not path.exists():
-            mismatches.append(f"{rel} (missing)")
-            verification_details.append({
-                "path": rel,
-                "expected_hash": expected_hash,
-                "read_hash": None,
-                "match": False,
-                "note": "missing",
-            })
-            continue
-        try:
-            h = _hash_file_chunked(path, WRITE_CHUNK_BYTES)
-            match = h == expected_hash
-            verification_details.append({
-                "path": rel,
-                "expected_hash": expected_hash,
-                "read_hash": h,
-                "match": match,
-                "note": None,
-            })
-            if not match:
-                mismatches.append(rel)
-        except OSError:
-            mismatches.append(f"{rel} (read error)")
-            verification_details.append({
-                "path": rel,
-                "expected_hash": expected_hash,
-                "read_hash": None,
-                "match": False,
-                "note": "read error",
-            })
+    if _NEEDS_NORM:
+        paths = [root_str + rel.replace("/", os.sep) for rel in manifest]
+    else:
+        paths = [root_str + rel for rel in manifest]
+
+    stat_only = [mode == "stat" and "s" in entry and "m" in entry for _, entry in entries]
+    to_hash = [
+        (path, "c" if "c" in entry else "h")
+        for path, (_, entry), skip in zip(paths, entries, stat_only)
+        if not skip
+    ]
+
+    with closing(_hash_files(to_hash, abort_check=abort_check)) as results:
+        for i, ((rel, entry), path, by_stat) in enumerate(zip(entries, paths, stat_only)):
+            expected_hash = entry["h"]
+            if abort_check and abort_check():
+                return len(mismatches) == 0, mismatches, verification_details, True
+            if progress_callback and progress_callback.due(i, total):
+                progress_callback(i, total, f"Verifying files: {rel[:40]}…")
+            note = None
+            if by_stat:
+                try:
+                    st = os.stat(path)
+                except OSError as e:
+                    h = e  # reported as missing / read error below
+                else:
+                    match = st.st_size == entry["s"] and st.st_mtime_ns == entry["m"]
+                    verification_details.append({
+                        "path": rel,
+                        "expected_hash": expected_hash,
+                        "read_hash": None,
+                        "match": match,
+                        "note": "stat-only",
+                    })
+                    if not match:
+                        mismatches.append(f"{rel} (size/mtime changed)")
+                    continue
+            else:
+                h = next(results)
+                if h is None:
+                    return len(mismatches) == 0, mismatches, verification_details, True
+                if isinstance(h, dict) and "c" in h:
+                    if h["c"] == entry["c"]:
+                        verification_details.append({
+                            "path": rel,
+                            "expected_hash": expected_hash,
+                            "read_hash": None,
+                            "match": True,
+                            "note": "crc32",
+                        })
+                        continue
+                    try:  # CRC differs: read again for the SHA-256 to report
+                        h = _hash_file_chunked(
+                            path, _pick_chunk_size(entry.get("s", 0)), abort_check=abort_check
+                        )
+                    except OSError as e:
+                        h = e
+                    else:
+                        if h is None:
+                            return len(mismatches) == 0, mismatches, verification_details, True
+                        if h == expected_hash:
+                            note = "crc mismatch; sha re-read matched"
+                elif isinstance(h, dict):
+                    h = h["h"]
+            if isinstance(h, FileNotFoundError):
+                mismatches.append(f"{rel} (missing)")
+                verification_details.append({
+                    "path": rel,
+                    "expected_hash": expected_hash,
+                    "read_hash": None,
+                    "match": False,
+                    "note": "missing",
+                })
+            elif isinstance(h, OSError):
+                mismatches.append(f"{rel} (read error)")
+                verification_details.append({
+                    "path": rel,
+                    "expected_hash": expected_hash,
+                    "read_hash": None,
+                    "match": False,
+                    "note": "read error",
+                })
+            else:
+                match = h == expected_hash and note is None
+                verification_details.append({
+                    "path": rel,
+                    "expected_hash": expected_hash,
+                    "read_hash": h,
+                    "match": match,
+                    "note": note,
+                })
+                if note:
+                    mismatches.append(f"{rel} ({note})")
+                elif not match:
+                    mismatches.append(rel)
 
     return len(mismatches) == 0, mismatches, verification_details, False
 
@@ -178,10 +380,13 @@ def free_space_sweep(
     drive_root: str, progress_callback=None, abort_check=None
 ) -> dict:
     """
-    Write/verify/delete over all free space (minus safety margin). Same pattern as quick_check.
+    Write/verify/delete over all free space (minus safety margin). Same pattern as quick_check,
+    but each batch is verified with a single uncached read.
     Returns dict with passed, message, details.
     """
-    total_bytes_d, free_bytes_d = get_drive_usage(drive_root)
+    if progress_callback:
+        progress_callback = _Throttled(progress_callback)
+    total_bytes_d, free_bytes_d = get_drive_usage(drive_root, fresh=True)
     usable_bytes = max(0, free_bytes_d - SAFETY_MARGIN_BYTES)
 
     if usable_bytes < 1024:
@@ -198,8 +403,9 @@ def free_space_sweep(
     while remaining > 0:
         batch_sizes.append(min(remaining, MAX_FILE_BYTES))
         remaining -= batch_sizes[-1]
+    buf = _aligned_buffer(_pick_chunk_size(batch_sizes[0]))  # one read buffer for every verify pass
     num_batches = len(batch_sizes)
-    total_steps = num_batches * 3
+    total_steps = num_batches * 2
 
     date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
     short_random = secrets.token_hex(4)
@@ -216,46 +422,21 @@ def free_space_sweep(
             "verification_details": [],
         }
 
+    aborted = False
     try:
         for batch_i, fsize in enumerate(batch_sizes):
             if abort_check and abort_check():
-                batches_done = len(verification_details)
-                bytes_tested = sum(batch_sizes[i] for i in range(batches_done))
-                confidence_pct = round(100 * bytes_tested / usable_bytes) if usable_bytes else 0
-                return {
-                    "passed": all(v.get("match", False) for v in verification_details),
-                    "message": "Free-space sweep aborted by user",
-                    "details": (
-                        f"{batches_done}/{num_batches} batches completed, all passed. "
-                        f"{bytes_tested:,} of {usable_bytes:,} bytes (~{confidence_pct}%). "
-                        f"Extrapolated: no failures in tested area."
-                    ),
-                    "verification_details": verification_details,
-                    "aborted": True,
-                    "batches_completed": batches_done,
-                    "batches_total": num_batches,
-                    "bytes_tested": bytes_tested,
-                    "bytes_total": usable_bytes,
-                    "extrapolated_confidence_pct": confidence_pct,
-                }
+                aborted = True
+                break
             file_path = temp_path / f"test_{batch_i}.bin"
             if progress_callback:
                 progress_callback(
-                    batch_i * 3,
+                    batch_i * 2,
                     total_steps,
                     f"Free space: writing batch {batch_i + 1}/{num_batches}…",
                 )
-            hasher = hashlib.sha256()
-            rng = random.Random(batch_i)
             try:
-                with open(file_path, "wb") as f:
-                    written = 0
-                    while written < fsize:
-                        chunk_size = min(WRITE_CHUNK_BYTES, fsize - written)
-                        chunk = rng.randbytes(chunk_size)
-                        hasher.update(chunk)
-                        f.write(chunk)
-                        written += chunk_size
+                expected_hash = _write_test_file(file_path, fsize, batch_i, abort_check)
             except OSError as e:
                 return {
                     "passed": False,
@@ -263,69 +444,69 @@ def free_space_sweep(
                     "details": f"Write error (batch {batch_i + 1}): {e}",
                     "verification_details": verification_details,
                 }
-            expected_hash = hasher.hexdigest()
+            if expected_hash is None:
+                aborted = True
+                break
 
             if progress_callback:
                 progress_callback(
-                    batch_i * 3 + 1,
+                    batch_i * 2 + 1,
                     total_steps,
-                    f"Free space: verifying batch {batch_i + 1}/{num_batches} (read 1)…",
+                    f"Free space: verifying batch {batch_i + 1}/{num_batches}…",
                 )
             try:
-                h1 = _hash_file_chunked(file_path, WRITE_CHUNK_BYTES)
-            except OSError as e:
-                return {
-                    "passed": False,
-                    "message": "Free-space sweep failed",
-                    "details": f"Read error (batch {batch_i + 1}): {e}",
-                    "verification_details": verification_details,
-                }
-            if h1 != expected_hash:
-                verification_details.append({
-                    "batch": batch_i + 1,
-                    "expected_hash": expected_hash,
-                    "read1_hash": h1,
-                    "read2_hash": None,
-                    "match": False,
-                })
-                return {
-                    "passed": False,
-                    "message": "Free-space sweep failed",
-                    "details": f"Hash mismatch on batch {batch_i + 1} (first read).",
-                    "verification_details": verification_details,
-                }
-
-            if progress_callback:
-                progress_callback(
-                    batch_i * 3 + 2,
-                    total_steps,
-                    f"Free space: verifying batch {batch_i + 1}/{num_batches} (read 2)…",
+                h1 = _hash_file_chunked(
+                    file_path, _pick_chunk_size(fsize), buf, uncached=True, abort_check=abort_check
                 )
-            try:
-                h2 = _hash_file_chunked(file_path, WRITE_CHUNK_BYTES)
             except OSError as e:
                 return {
                     "passed": False,
                     "message": "Free-space sweep failed",
-                    "details": f"Read error (batch {batch_i + 1}, second pass): {e}",
+                    "details": f"Read error (batch {batch_i + 1}): {e}",
                     "verification_details": verification_details,
                 }
-            match = h1 == expected_hash and h2 == expected_hash and h1 == h2
+            if h1 is None:
+                aborted = True
+                break
+            # One uncached read per batch: the data comes from the card, so a second
+            # pass would only repeat the same media read
+            match = h1 == expected_hash
             verification_details.append({
                 "batch": batch_i + 1,
                 "expected_hash": expected_hash,
                 "read1_hash": h1,
-                "read2_hash": h2,
+                "read2_hash": None,
                 "match": match,
             })
             if not match:
                 return {
                     "passed": False,
                     "message": "Free-space sweep failed",
-                    "details": f"Hash mismatch on batch {batch_i + 1} (second read).",
+                    "details": f"Hash mismatch on batch {batch_i + 1}.",
                     "verification_details": verification_details,
                 }
 
+        if aborted:
+            batches_done = len(verification_details)
+            bytes_tested = sum(batch_sizes[i] for i in range(batches_done))
+            confidence_pct = round(100 * bytes_tested / usable_bytes) if usable_bytes else 0
+            return {
+                "passed": all(v.get("match", False) for v in verification_details),
+                "message": "Free-space sweep aborted by user",
+                "details": (
+                    f"{batches_done}/{num_batches} batches completed, all passed. "
+                    f"{bytes_tested:,} of {usable_bytes:,} bytes (~{confidence_pct}%). "
+                    f"Extrapolated: no failures in tested area."
+                ),
+                "verification_details": verification_details,
+                "aborted": True,
+                "batches_completed": batches_done,
+                "batches_total": num_batches,
+                "bytes_tested": bytes_tested,
+                "bytes_total": usable_bytes,
+                "extrapolated_confidence_pct": confidence_pct,
+            }
+
         if progress_callback:
             progress_callback(total_steps, total_steps, "Cleaning up…")
         return {
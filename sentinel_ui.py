@@ -2,21 +2,81 @@
 
 import time
 import tkinter as tk
+from datetime import datetime
 from tkinter import ttk, messagebox
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from sentinel import __version__
 from sentinel.eula import EULA_TEXT
 from sentinel.drive import get_available_drives
 from sentinel.config import load_config, save_config
 from sentinel.core import quick_check
-from sentinel.sweep import full_sweep, sweep_due
+from sentinel.sweep import _due_since, full_sweep, read_last_sweep_timestamp
 from sentinel.recommendation import (
     recommend_schedule,
     get_quality_warnings,
     recommend_check_size_fraction,
 )
 
+PROGRESS_POLL_MS = 80  # how often the UI picks up worker progress while an operation runs
+PROGRESS_BAR_MIN_STEP = 0.5  # percent; smaller moves aren't visible, so skip the redraw
+PROGRESS_TEXT_MIN_INTERVAL = 0.25  # seconds between time-remaining refreshes for the same message
+LAST_SWEEP_TTL_SECONDS = 5.0  # re-read the card's .last_sweep at most this often per drive
+DRIVES_TTL_SECONDS = 5.0  # re-enumerate drives (when the list is opened) at most this often
+BACKGROUND_POLL_MS = 50  # how often the UI checks on a background task
+TIME_DISPLAY_FORMAT = "%Y-%m-%d %H:%M"
+
+# Verification detail rows, filled with format_map from _detail_fields()
+_QUICK_FMT = "Batch {batch}: expected {expected_hash} | read1 {read1_hash} | read2 {read2_hash} | Match: {match}"
+_FILE_FMT = "{path}: expected {expected_hash} | read {read_hash} | Match: {match}{note}"
+_FREE_FMT = "Batch {batch}: expected {expected_hash} | {reads} | Match: {match}"
+_DETAIL_DEFAULTS = {
+    "batch": "?",
+    "path": "?",
+    "expected_hash": "?",
+    "read_hash": "?",
+    "read1_hash": "?",
+    "read2_hash": "?",
+}
+
+
+def _format_config_time(value) -> str:
+    """Config ISO timestamp as shown in the UI; "" if missing or invalid."""
+    if not value:
+        return ""
+    try:
+        return datetime.fromisoformat(value).strftime(TIME_DISPLAY_FORMAT)
+    except (ValueError, TypeError):
+        return ""
+
+
+def _detail_fields(d: dict) -> dict:
+    """Template fields for one verification_details entry: defaults filled, match as yes/NO."""
+    return {**_DETAIL_DEFAULTS, **d, "match": "yes" if d.get("match") else "NO"}
+
+
+def _file_fields(d: dict) -> dict:
+    fields = _detail_fields(d)
+    fields["note"] = f" [{d['note']}]" if d.get("note") else ""
+    return fields
+
+
+def _free_fields(d: dict) -> dict:
+    fields = _detail_fields(d)
+    r1, r2 = fields["read1_hash"], d.get("read2_hash")
+    fields["reads"] = f"read1 {r1} | read2 {r2}" if r2 is not None else f"read {r1}"
+    return fields
+
+
+def _format_remaining(sec: float) -> str:
+    if sec < 60:
+        return f"~{int(sec)} sec"
+    m, s = divmod(int(sec), 60)
+    if s == 0:
+        return f"~{m} min"
+    return f"~{m} min {s} sec"
+
 
 class SentinelUI:
     def __init__(self):
@@ -24,15 +84,30 @@ class SentinelUI:
         self.root.title(f"Sentinel {__version__} — Standing vigil")
         self.root.minsize(420, 320)
         self.root.resizable(True, True)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.drive_var = tk.StringVar()
-        self.result_var = tk.StringVar(value="—")
-        self.progress_var = tk.StringVar(value="")
         self.sweep_due_var = tk.StringVar(value="")
         self.operation_running = False
-        self.operation_thread = None
-        self._verification_details_text = ""
+        # One long operation plus one short background task (drive enumeration) at a time
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sentinel-op")
+        self._current_future = None  # running quick check / full sweep
+        self._verification_result = None  # (result, check_type) of the last operation; formatted on copy
         self._abort_requested = False
+        self._closing = False  # window closed while an operation runs; destroyed once it stops
+        # Latest (current, total, message) from the worker; drained by _drain_progress
+        self._progress_lock = threading.Lock()
+        self._progress_state = None
+        self._progress_poll_id = None
+        self._op_start_time = 0.0
+        self._last_bar_pct = -1.0
+        self._last_progress_text = (None, 0.0)  # (message, monotonic time shown)
+        self._last_sweep_cache = {}  # drive -> (monotonic time read, timestamp or None)
+        self._drives_cache = (0.0, [])  # (monotonic time enumerated, drives)
+        self._drives_refreshing = False
+        self._drive_values = ()  # what the drive combobox currently lists
+        self._fmt_last_check = None  # formatted config last_check_time ("" = none); None = not read yet
+        self._fmt_last_sweep = None
 
         # Show EULA first; main UI is built after user agrees
         self._build_eula_screen()
@@ -53,6 +128,8 @@ class SentinelUI:
 
         scrollbar = ttk.Scrollbar(text_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._eula_scrollbar = scrollbar
+        self._eula_bottomed = False
 
         self._eula_text = tk.Text(
             text_frame,
@@ -71,7 +148,8 @@ class SentinelUI:
         self._eula_text.config(state=tk.DISABLED)
 
         def after_scroll(_event=None):
-            self.root.after(50, self._check_eula_scrolled_to_bottom)
+            if not self._eula_bottomed:
+                self.root.after_idle(self._check_eula_scrolled_to_bottom)
 
         self._eula_text.bind("<MouseWheel>", after_scroll)
         self._eula_text.bind("<Button-4>", after_scroll)
@@ -92,19 +170,29 @@ class SentinelUI:
         self.root.after(100, self._check_eula_scrolled_to_bottom)
 
     def _make_eula_scroll_command(self, scrollbar):
-        """Wrap scrollbar.set so we also check if user scrolled to bottom."""
+        """Wrap scrollbar.set so we also check if user scrolled to bottom (until they have)."""
 
-        def on_scroll(*args):
-            scrollbar.set(*args)
-            self._check_eula_scrolled_to_bottom()
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            self._check_eula_scrolled_to_bottom(last)
 
         return on_scroll
 
-    def _check_eula_scrolled_to_bottom(self):
-        """Enable I Agree only when user has scrolled to the bottom."""
+    def _check_eula_scrolled_to_bottom(self, last=None):
+        """
+        Enable I Agree only when user has scrolled to the bottom. last: bottom of the visible
+        fraction if the caller already has it (saves a yview() call). One-shot: once enabled,
+        the scroll hook goes back to plain scrollbar.set and later calls return immediately.
+        """
+        if self._eula_bottomed:
+            return
         try:
-            if self._eula_text.yview()[1] >= 0.999:
+            if last is None:
+                last = self._eula_text.yview()[1]
+            if float(last) >= 0.999:
+                self._eula_bottomed = True
                 self._eula_agree_btn.state(["!disabled"])
+                self._eula_text.configure(yscrollcommand=self._eula_scrollbar.set)
         except (AttributeError, tk.TclError):
             pass
 
@@ -114,6 +202,7 @@ class SentinelUI:
         del self._eula_frame
         del self._eula_text
         del self._eula_agree_btn
+        del self._eula_scrollbar
         self._build_ui()
         self._load_drives_and_config()
         self.interval_combo.bind("<<ComboboxSelected>>", self._on_interval_change)
@@ -125,7 +214,11 @@ class SentinelUI:
         # Drive selector
         ttk.Label(main, text="Drive:").pack(anchor=tk.W)
         self.drive_combo = ttk.Combobox(
-            main, textvariable=self.drive_var, state="readonly", width=40
+            main,
+            textvariable=self.drive_var,
+            state="readonly",
+            width=40,
+            postcommand=self._refresh_drives,
         )
         self.drive_combo.pack(fill=tk.X, pady=(0, 5))
         self.drive_combo.bind("<<ComboboxSelected>>", self._on_drive_change)
@@ -179,16 +272,16 @@ class SentinelUI:
         self.abort_btn.pack(side=tk.LEFT)
 
         # Progress
-        self.progress_label = ttk.Label(main, textvariable=self.progress_var)
+        self.progress_label = ttk.Label(main, text="")  # set via configure(text=); no StringVar trace
         self.progress_label.pack(pady=(0, 5))
 
-        self.progress_bar = ttk.Progressbar(main, mode="determinate")
+        self.progress_bar = ttk.Progressbar(main, mode="determinate", maximum=100)
         self.progress_bar.pack(fill=tk.X, pady=(0, 15))
 
         # Result
         ttk.Label(main, text="Result:", font=("", 10, "bold")).pack(anchor=tk.W)
         self.result_label = ttk.Label(
-            main, textvariable=self.result_var, wraplength=400
+            main, text="—", wraplength=400
         )
         self.result_label.pack(anchor=tk.W, pady=(0, 5))
 
@@ -204,11 +297,13 @@ class SentinelUI:
             wraplength=400,
         ).pack(anchor=tk.W, pady=(10, 0))
 
-    def _load_drives_and_config(self):
-        drives = get_available_drives()
-        self.drive_combo["values"] = drives
+    def _load_drives_and_config(self, drives=None):
+        if drives is None:
+            drives = get_available_drives()
+        self._drives_cache = (time.monotonic(), drives)
+        self._set_drive_values(drives)
         if not drives:
-            self.result_var.set("No drives found.")
+            self.result_label.configure(text="No drives found.")
             self.run_btn.state(["disabled"])
             self.sweep_btn.state(["disabled"])
             return
@@ -222,6 +317,74 @@ class SentinelUI:
         self.interval_var.set(str(interval))
         self._update_sweep_due()
 
+    def _refresh_drives(self):
+        """
+        Drive list postcommand: re-enumerate drives on a worker thread if the list is older than
+        DRIVES_TTL_SECONDS, so a slow volume (e.g. an empty card reader) never blocks the UI.
+        The new list shows the next time the drop-down opens.
+        """
+        if self._drives_refreshing or time.monotonic() - self._drives_cache[0] < DRIVES_TTL_SECONDS:
+            return
+        self._drives_refreshing = True
+        self._run_in_background(get_available_drives, self._apply_drives)
+
+    def _apply_drives(self, drives):
+        """Show a re-enumerated drive list (None = enumeration failed; keep the old one)."""
+        self._drives_refreshing = False
+        if drives is None:
+            return
+        self._drives_cache = (time.monotonic(), drives)
+        self._set_drive_values(drives)
+        if drives and not self.drive_var.get() and not self.operation_running:
+            # No drive at startup and one has appeared: select it as at startup
+            self._set_buttons_enabled(True)
+            self.result_label.configure(text="—")  # clear "No drives found."
+            self._load_drives_and_config(drives)
+
+    def _set_drive_values(self, drives):
+        """Give the drive combobox a new list, skipping the Tcl list rebuild if it is unchanged."""
+        values = tuple(drives)
+        if values != self._drive_values:
+            self.drive_combo["values"] = values
+            self._drive_values = values
+
+    def _run_in_background(self, fn, on_done):
+        """Run fn() on the worker pool, then on_done(result) on the Tk thread (None if fn raised)."""
+        self._watch(
+            self._pool.submit(fn),
+            lambda fut: on_done(None if fut.cancelled() or fut.exception() else fut.result()),
+        )
+
+    def _watch(self, fut, on_done):
+        """Poll fut from the Tk thread; once it is done, call on_done(fut) there."""
+
+        def poll():
+            if fut.done():
+                on_done(fut)
+            else:
+                self.root.after(BACKGROUND_POLL_MS, poll)
+
+        self.root.after(BACKGROUND_POLL_MS, poll)
+
+    def _finish_operation(self, fut, on_done):
+        """
+        Operation future finished: drop our reference to it and call on_done(result). If the
+        operation raised, reset the UI and show the error instead.
+        """
+        self._current_future = None
+        if self._closing:
+            self._destroy()
+            return
+        exc = fut.exception()
+        if exc is not None:
+            self.operation_running = False
+            self._abort_requested = False
+            self._set_buttons_enabled(True)
+            self.progress_label.configure(text="")
+            self.result_label.configure(text=f"Error — {exc}", foreground="red")
+            return
+        on_done(fut.result())
+
     def _update_sweep_due(self):
         drive = self._get_drive()
         if not drive:
@@ -234,7 +397,8 @@ class SentinelUI:
             interval = int(self.interval_var.get())
         except ValueError:
             interval = 14
-        due = sweep_due(drive, interval)
+        ts = self._last_sweep_timestamp(drive)
+        due = _due_since(ts, interval)
         if due:
             self.sweep_due_var.set("Full sweep due.")
         else:
@@ -245,46 +409,41 @@ class SentinelUI:
         # Quality warnings
         warnings = get_quality_warnings(drive)
         self.warnings_var.set("; ".join(warnings) if warnings else "")
-        # Last check / sweep
-        config = load_config()
+        # Last check / sweep (config times are parsed once, then kept formatted)
+        if self._fmt_last_check is None or self._fmt_last_sweep is None:
+            config = load_config()
+            self._fmt_last_check = _format_config_time(config.get("last_check_time"))
+            self._fmt_last_sweep = _format_config_time(config.get("last_sweep_time"))
         lines = []
-        lct = config.get("last_check_time")
-        if lct:
-            try:
-                from datetime import datetime
-
-                dt = datetime.fromisoformat(lct)
-                lines.append(f"Last quick check: {dt.strftime('%Y-%m-%d %H:%M')}")
-            except (ValueError, TypeError):
-                pass
-        from sentinel.sweep import read_last_sweep_timestamp
-
-        ts = read_last_sweep_timestamp(drive) if drive else None
+        if self._fmt_last_check:
+            lines.append(f"Last quick check: {self._fmt_last_check}")
         if ts:
-            lines.append(f"Last full sweep: {ts.strftime('%Y-%m-%d %H:%M')}")
-        elif config.get("last_sweep_time"):
-            try:
-                from datetime import datetime
-
-                dt = datetime.fromisoformat(config["last_sweep_time"])
-                lines.append(f"Last full sweep: {dt.strftime('%Y-%m-%d %H:%M')}")
-            except (ValueError, TypeError, KeyError):
-                pass
+            lines.append(f"Last full sweep: {ts.strftime(TIME_DISPLAY_FORMAT)}")
+        elif self._fmt_last_sweep:
+            lines.append(f"Last full sweep: {self._fmt_last_sweep}")
         self.last_check_var.set(" | ".join(lines) if lines else "")
 
+    def _last_sweep_timestamp(self, drive: str):
+        """read_last_sweep_timestamp(drive), cached for LAST_SWEEP_TTL_SECONDS."""
+        now = time.monotonic()
+        cached = self._last_sweep_cache.get(drive)
+        if cached is not None and now - cached[0] < LAST_SWEEP_TTL_SECONDS:
+            return cached[1]
+        ts = read_last_sweep_timestamp(drive)
+        self._last_sweep_cache[drive] = (now, ts)
+        return ts
+
     def _format_verification_details(self, result: dict, check_type: str) -> str:
-        """Format verification_details for display/copy."""
+        """
+        Format verification_details for copying. Pure Python (no Tk), so it runs on the worker
+        pool, and only when the user copies: a full sweep can have an entry per file on the card.
+        """
         if check_type == "quick_check":
             vd = result.get("verification_details", [])
             if not vd:
                 return "(no verification data)"
             lines = ["=== Quick Check Verification ==="]
-            for d in vd:
-                exp = d.get("expected_hash", "?")
-                r1 = d.get("read1_hash", "?")
-                r2 = d.get("read2_hash", "?")
-                match = "yes" if d.get("match") else "NO"
-                lines.append(f"Batch {d.get('batch', '?')}: expected {exp} | read1 {r1} | read2 {r2} | Match: {match}")
+            lines += [_QUICK_FMT.format_map(_detail_fields(d)) for d in vd]
             return "\n".join(lines)
         elif check_type == "full_sweep":
             vd = result.get("verification_details", {})
@@ -293,30 +452,28 @@ class SentinelUI:
             lines = ["=== Full Sweep Verification ==="]
             if manifest_vd:
                 lines.append("--- Manifest (file verification) ---")
-                for d in manifest_vd:
-                    path = d.get("path", "?")
-                    exp = d.get("expected_hash", "?")
-                    read_h = d.get("read_hash", "?")
-                    match = "yes" if d.get("match") else "NO"
-                    note = f" [{d.get('note', '')}]" if d.get("note") else ""
-                    lines.append(f"{path}: expected {exp} | read {read_h} | Match: {match}{note}")
+                lines += [_FILE_FMT.format_map(_file_fields(d)) for d in manifest_vd]
             if free_vd:
                 lines.append("--- Free Space ---")
-                for d in free_vd:
-                    exp = d.get("expected_hash", "?")
-                    r1 = d.get("read1_hash", "?")
-                    r2 = d.get("read2_hash", "?")
-                    match = "yes" if d.get("match") else "NO"
-                    lines.append(f"Batch {d.get('batch', '?')}: expected {exp} | read1 {r1} | read2 {r2} | Match: {match}")
+                lines += [_FREE_FMT.format_map(_free_fields(d)) for d in free_vd]
             if not manifest_vd and not free_vd:
                 return "(no verification data)"
             return "\n".join(lines)
         return "(unknown)"
 
     def _copy_verification(self):
-        if self._verification_details_text.strip():
-            self.root.clipboard_clear()
-            self.root.clipboard_append(self._verification_details_text)
+        """Format the last operation's verification details on the pool, then copy them."""
+        if self._verification_result is None:
+            return
+
+        def to_clipboard(text):
+            if text and text.strip():
+                self.root.clipboard_clear()
+                self.root.clipboard_append(text)
+
+        self._run_in_background(
+            lambda r=self._verification_result: self._format_verification_details(*r), to_clipboard
+        )
 
     def _get_drive(self) -> str | None:
         drive = self.drive_var.get().strip()
@@ -349,6 +506,10 @@ class SentinelUI:
     def _on_abort_click(self):
         self._abort_requested = True
 
+    def _abort_check(self) -> bool:
+        """abort_check for quick_check/full_sweep (called on the worker thread)."""
+        return self._abort_requested
+
     def _on_full_sweep_click(self):
         if self.operation_running:
             return
@@ -369,61 +530,88 @@ class SentinelUI:
         self.sweep_btn.state(state)
         self.abort_btn.state(["disabled"] if enabled else ["!disabled"])
 
+    def _post_progress(self, current, total, message):
+        """Progress callback for the worker thread: only records the latest state, no Tk calls."""
+        with self._progress_lock:
+            self._progress_state = (current, total, message)
+
+    def _post_phase(self, phase):
+        """Phase callback for the worker thread (full sweep); shown like a progress message."""
+        self._post_progress(0, 0, f"Phase: {phase}…")
+
+    def _start_progress_polling(self):
+        self._op_start_time = time.time()
+        self._last_bar_pct = -1.0
+        self._last_progress_text = (None, 0.0)
+        with self._progress_lock:
+            self._progress_state = None
+        if self._progress_poll_id is None:
+            self._progress_poll_id = self.root.after(PROGRESS_POLL_MS, self._drain_progress)
+
+    def _drain_progress(self):
+        """Show the latest worker progress (at most once per poll); re-arms while an operation runs."""
+        if not self.operation_running or self._closing:
+            self._progress_poll_id = None
+            return  # finished or closing: leave "Done." / "Stopping…" in place
+        with self._progress_lock:
+            state, self._progress_state = self._progress_state, None
+        if state is not None:
+            self._apply_progress(*state)
+        self._progress_poll_id = self.root.after(PROGRESS_POLL_MS, self._drain_progress)
+
+    def _apply_progress(self, current, total, message):
+        """
+        Update progress bar and text (with time remaining) for one progress state. The bar is
+        only redrawn when it moves by PROGRESS_BAR_MIN_STEP (or completes), and the time
+        remaining for an unchanged message at most every PROGRESS_TEXT_MIN_INTERVAL.
+        """
+        if total > 0:
+            pct = 100 * current / total
+            if pct >= 100 or abs(pct - self._last_bar_pct) >= PROGRESS_BAR_MIN_STEP:
+                self.progress_bar["value"] = pct
+                self._last_bar_pct = pct
+        now = time.monotonic()
+        last_message, last_time = self._last_progress_text
+        if message == last_message and now - last_time < PROGRESS_TEXT_MIN_INTERVAL:
+            return
+        self._last_progress_text = (message, now)
+        if total > 0 and 0 < current < total:
+            elapsed = time.time() - self._op_start_time
+            remaining_sec = elapsed / current * (total - current)
+            self.progress_label.configure(text=f"{message} — {_format_remaining(remaining_sec)} remaining")
+        else:
+            self.progress_label.configure(text=message)
+
     def _start_quick_check(self, drive: str, size_frac: float):
         self.operation_running = True
         self._abort_requested = False
         self._set_buttons_enabled(False)
-        self.result_var.set("Running…")
-        self.progress_var.set("")
-        self._verification_details_text = ""
+        self.result_label.configure(text="Running…")
+        self.progress_label.configure(text="")
+        self._verification_result = None
         self.progress_bar["value"] = 0
-        self.progress_bar["maximum"] = 100
-        start_time = time.time()
-
-        def _format_remaining(sec: float) -> str:
-            if sec < 60:
-                return f"~{int(sec)} sec"
-            m, s = divmod(int(sec), 60)
-            if s == 0:
-                return f"~{m} min"
-            return f"~{m} min {s} sec"
-
-        def progress_cb(current, total, message):
-            def update():
-                if total > 0:
-                    pct = 100 * current / total
-                    self.progress_bar["value"] = pct
-                    elapsed = time.time() - start_time
-                    if current > 0 and current < total:
-                        rate = elapsed / current
-                        remaining_sec = rate * (total - current)
-                        self.progress_var.set(
-                            f"{message} — {_format_remaining(remaining_sec)} remaining"
-                        )
-                    else:
-                        self.progress_var.set(message)
-                else:
-                    self.progress_var.set(message)
-                self.root.after(0, update)
+        self._start_progress_polling()
 
         def run():
             result = quick_check(
                 drive,
                 size_frac,
-                progress_callback=progress_cb,
-                abort_check=lambda: self._abort_requested,
+                progress_callback=self._post_progress,
+                abort_check=self._abort_check,
             )
-            self.root.after(0, lambda: self._on_quick_check_done(result))
+            return result
 
-        self.operation_thread = threading.Thread(target=run, daemon=True)
-        self.operation_thread.start()
+        self._current_future = self._pool.submit(run)
+        self._watch(
+            self._current_future, lambda fut: self._finish_operation(fut, self._on_quick_check_done)
+        )
 
     def _on_quick_check_done(self, result: dict):
         self.operation_running = False
         self._abort_requested = False
         self._set_buttons_enabled(True)
         self.progress_bar["value"] = 100
-        self.progress_var.set("Done.")
+        self.progress_label.configure(text="Done.")
 
         passed = result.get("passed", False)
         msg = result.get("message", "Unknown")
@@ -432,85 +620,57 @@ class SentinelUI:
 
         if aborted:
             confidence = result.get("extrapolated_confidence_pct")
-            self.result_var.set(
-                f"Aborted — {msg}\n{details}"
-                + (f" (extrapolated confidence: ~{confidence}%)" if confidence is not None else "")
+            self.result_label.configure(
+                text=f"Aborted — {msg}\n{details}"
+                + (f" (extrapolated confidence: ~{confidence}%)" if confidence is not None else ""),
+                foreground="red",
             )
-            self.result_label.configure(foreground="red")
         elif passed:
-            self.result_var.set(f"Pass — {msg}")
-            self.result_label.configure(foreground="")
+            self.result_label.configure(text=f"Pass — {msg}", foreground="")
         else:
-            self.result_var.set(f"Fail — {msg}")
-            if details:
-                self.result_var.set(f"Fail — {msg}\n{details}")
-            self.result_label.configure(foreground="red")
-
-        self._verification_details_text = self._format_verification_details(result, "quick_check")
+            text = f"Fail — {msg}\n{details}" if details else f"Fail — {msg}"
+            self.result_label.configure(text=text, foreground="red")
 
-        from datetime import datetime
+        self._verification_result = (result, "quick_check")
 
+        now = datetime.now()
         save_config(
             last_drive=self.drive_var.get(),
-            last_check_time=datetime.now().isoformat(),
+            last_check_time=now.isoformat(),
         )
+        self._fmt_last_check = now.strftime(TIME_DISPLAY_FORMAT)
         self._update_sweep_due()
 
     def _start_full_sweep(self, drive: str):
         self.operation_running = True
         self._abort_requested = False
         self._set_buttons_enabled(False)
-        self.result_var.set("Full sweep running (can take 1+ hours)…")
-        self.progress_var.set("")
-        self._verification_details_text = ""
+        self.result_label.configure(text="Full sweep running (can take 1+ hours)…")
+        self.progress_label.configure(text="")
+        self._verification_result = None
         self.progress_bar["value"] = 0
-        self.progress_bar["maximum"] = 100
-        start_time = time.time()
-
-        def _format_remaining(sec: float) -> str:
-            if sec < 60:
-                return f"~{int(sec)} sec"
-            m, s = divmod(int(sec), 60)
-            if s == 0:
-                return f"~{m} min"
-            return f"~{m} min {s} sec"
-
-        def progress_cb(current, total, message):
-            def update():
-                if total > 0:
-                    pct = 100 * current / total
-                    self.progress_bar["value"] = pct
-                elapsed = time.time() - start_time
-                if total > 0 and current > 0 and current < total:
-                    rate = elapsed / current
-                    remaining_sec = rate * (total - current)
-                    self.progress_var.set(
-                        f"{message} — {_format_remaining(remaining_sec)} remaining"
-                    )
-                else:
-                    self.progress_var.set(message)
-            self.root.after(0, update)
+        self._start_progress_polling()
 
         def run():
             result = full_sweep(
                 drive,
-                progress_callback=progress_cb,
-                manifest_callback=lambda p: self.root.after(
-                    0, lambda phase=p: self.progress_var.set(f"Phase: {phase}…")
-                ),
-                abort_check=lambda: self._abort_requested,
+                progress_callback=self._post_progress,
+                manifest_callback=self._post_phase,
+                abort_check=self._abort_check,
             )
-            self.root.after(0, lambda: self._on_full_sweep_done(result))
+            return result
 
-        self.operation_thread = threading.Thread(target=run, daemon=True)
-        self.operation_thread.start()
+        self._current_future = self._pool.submit(run)
+        self._watch(
+            self._current_future, lambda fut: self._finish_operation(fut, self._on_full_sweep_done)
+        )
 
     def _on_full_sweep_done(self, result: dict):
         self.operation_running = False
         self._abort_requested = False
         self._set_buttons_enabled(True)
         self.progress_bar["value"] = 100
-        self.progress_var.set("Done.")
+        self.progress_label.configure(text="Done.")
 
         passed = result.get("passed", False)
         msg = result.get("message", "Unknown")
@@ -520,11 +680,9 @@ class SentinelUI:
         aborted = result.get("aborted", False)
 
         if aborted:
-            self.result_var.set(f"Aborted — {msg}\n{details}")
-            self.result_label.configure(foreground="red")
+            self.result_label.configure(text=f"Aborted — {msg}\n{details}", foreground="red")
         elif passed:
-            self.result_var.set(f"Pass — {msg}\n{details}")
-            self.result_label.configure(foreground="")
+            self.result_label.configure(text=f"Pass — {msg}\n{details}", foreground="")
         else:
             parts = [f"Fail — {msg}"]
             if not m_ok:
@@ -533,19 +691,39 @@ class SentinelUI:
                 parts.append("Free-space sweep failed.")
             if details:
                 parts.append(details)
-            self.result_var.set("\n".join(parts))
-            self.result_label.configure(foreground="red")
-
-        self._verification_details_text = self._format_verification_details(result, "full_sweep")
+            self.result_label.configure(text="\n".join(parts), foreground="red")
 
-        from datetime import datetime
+        self._verification_result = (result, "full_sweep")
+        self._last_sweep_cache.clear()  # the sweep may have written a new timestamp
 
+        now = datetime.now()
         save_config(
             last_drive=self.drive_var.get(),
-            last_sweep_time=datetime.now().isoformat(),
+            last_sweep_time=now.isoformat(),
         )
+        self._fmt_last_sweep = now.strftime(TIME_DISPLAY_FORMAT)
         self._update_sweep_due()
 
+    def _on_close(self):
+        """
+        Window closed: ask a running operation to stop. The window stays up showing "Stopping…"
+        until the worker has stopped (within one read/write chunk) and removed its test files,
+        so the process never lingers without a UI and a relaunch can't start a second check
+        on the same card meanwhile.
+        """
+        self._abort_requested = True
+        if self._current_future is None:
+            self._destroy()
+            return
+        self._closing = True
+        self.abort_btn.state(["disabled"])
+        self.progress_label.configure(text="Stopping…")
+
+    def _destroy(self):
+        """Drop queued background work and close the window."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def run(self):
         self.root.mainloop()
 